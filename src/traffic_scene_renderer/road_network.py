@@ -9,6 +9,7 @@ import matplotlib.pyplot as plt
 import numpy as np
 from matplotlib import patches
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
 from matplotlib.figure import Figure
 
 from .connection import Connection
@@ -269,12 +270,16 @@ class RoadNetwork:
                     x_plot.T, y_plot.T, color=way.options.side_color, zorder=way.options.layer
                 )
             if way.parms.plot.lines != []:
-                lines = np.array(way.parms.plot.lines)
-                self.parms.axes.plot(
-                    [lines[:, 0], lines[:, 2]],
-                    [lines[:, 1], lines[:, 3]],
-                    zorder=way.options.layer,
-                    color=way.options.line_color,
+                # Each line [e0, n0, e1, n1] is a segment; all segments are drawn as one artist.
+                # The caps are projecting, similar to the default of lines drawn with plot().
+                lines = list(np.reshape(way.parms.plot.lines, (-1, 2, 2)))
+                self.parms.axes.add_collection(
+                    LineCollection(
+                        lines,
+                        zorder=way.options.layer,
+                        colors=way.options.line_color,
+                        capstyle="projecting",
+                    )
                 )
             way.plot_markers(self.parms.axes)
 
@@ -8,13 +8,125 @@ from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection, PolyCollection
 from matplotlib.lines import Line2D
 from matplotlib.patches import Polygon as PPolygon
 from matplotlib.text import Text
+from matplotlib.transforms import Affine2D
 
 from .options import Options
 from .polygon import Polygon
-from .utilities import rotate
+from .utilities import unit_circle
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Make an array read-only, such that shared (module-level) data cannot be altered.
+
+    :param array: The array that is to be made read-only.
+    :return: The same array, which is now read-only.
+    """
+    array.setflags(write=False)
+    return array
+
+
+# Shapes of the turning arrows with unit width and length, as closed polygons (N-by-2).
+_RIGHT_ARROW = np.array(
+    [
+        [-0.3, -0.5],
+        [0.3, -0.5],
+        [0.12, 0.152],
+        [0.24, 0.174],
+        [0.42, 0.189],
+        [0.54, 0.189],
+        [0.54, 0.053],
+        [1.2, 0.242],
+        [0.54, 0.5],
+        [0.54, 0.28],
+        [0.3, 0.28],
+        [0.12, 0.265],
+        [-0.12, 0.227],
+        [-0.3, -0.5],
+    ]
+)
+_LEFTRIGHT_ARROW = np.array(
+    [
+        [-0.3, -0.5],
+        [0.3, -0.5],
+        [0.12, 0.152],
+        [0.24, 0.174],
+        [0.42, 0.189],
+        [0.54, 0.189],
+        [0.54, 0.053],
+        [1.2, 0.242],
+        [0.54, 0.5],
+        [0.54, 0.28],
+        [0.3, 0.28],
+        [0.12, 0.265],
+        [-0.12, 0.265],
+        [-0.3, 0.28],
+        [-0.54, 0.28],
+        [-0.54, 0.5],
+        [-1.2, 0.242],
+        [-0.54, 0.053],
+        [-0.54, 0.189],
+        [-0.42, 0.189],
+        [-0.24, 0.174],
+        [-0.12, 0.152],
+        [-0.3, -0.5],
+    ]
+)
+_THROUGHRIGHT_ARROW = np.array(
+    [
+        [0.3, -0.5],
+        [0.233, -0.102],
+        [0.433, -0.078],
+        [0.833, -0.063],
+        [0.9, -0.063],
+        [0.9, -0.133],
+        [1.3, -0.023],
+        [0.9, 0.102],
+        [0.9, 0.023],
+        [0.967, 0.023],
+        [0.433, 0.016],
+        [0.233, 0],
+        [0.167, 0],
+        [0.167, 0.117],
+        [0.5, 0.117],
+        [0, 0.5],
+        [-0.5, 0.117],
+        [-0.167, 0.117],
+        [-0.3, -0.5],
+        [0.3, -0.5],
+    ]
+)
+_THROUGH_ARROW = np.array(
+    [
+        [-0.3, -0.5],
+        [0.3, -0.5],
+        [0.167, 0.105],
+        [0.5, 0.105],
+        [0, 0.5],
+        [-0.5, 0.105],
+        [-0.167, 0.105],
+        [-0.3, -0.5],
+    ]
+)
+TURN_ARROW_VERTICES: Dict[str, np.ndarray] = {
+    "through": _read_only(_THROUGH_ARROW),
+    "left": _read_only(_RIGHT_ARROW * [-1, 1]),
+    "right": _read_only(_RIGHT_ARROW),
+    "leftright": _read_only(_LEFTRIGHT_ARROW),
+    "leftthrough": _read_only(_THROUGHRIGHT_ARROW * [-1, 1]),
+    "throughright": _read_only(_THROUGHRIGHT_ARROW),
+}
+
+# Corners of a rectangle with unit width and length that is centered at the origin.
+RECTANGLE_X = _read_only(np.array([-0.5, 0.5, 0.5, -0.5]))
+RECTANGLE_Y = _read_only(np.array([0.5, 0.5, -0.5, -0.5]))
+# The corners of a building start at the top right (instead of the top left), as users may rely on
+# the order of the default x_data and y_data of a building.
+_BUILDING_X = _read_only(np.array([0.5, 0.5, -0.5, -0.5]))
+_BUILDING_Y = _read_only(np.array([0.5, -0.5, -0.5, 0.5]))
 
 
 class StaticObjectPosition(Options):
@@ -34,12 +146,14 @@ class StaticObject(ABC):
         fills (Tuple): A tuple containing the handles for the filled areas.
         plots (Tuple): A tuple containing the handles for the line plots.
         texts (Tuple): A tuple containing the handles for text objects.
+        collections (Tuple): A tuple containing the handles for collections of filled areas.
     """
 
     axes: Axes
     fills: Tuple[Union[PPolygon, Polygon], ...]
     plots: Tuple[Line2D, ...]
     texts: Tuple[Text, ...]
+    collections: Tuple[Union[PolyCollection, LineCollection], ...]
     position: StaticObjectPosition
 
     def __init__(self, axes: Axes) -> None:
@@ -51,6 +165,7 @@ class StaticObject(ABC):
         self.fills = ()
         self.plots = ()
         self.texts = ()
+        self.collections = ()
         self.position = StaticObjectPosition()
 
     def change_pos(self, x_center: float, y_center: float, angle: float = 0) -> None:
@@ -60,28 +175,47 @@ class StaticObject(ABC):
         :param y_center: The new y-coordinate of the static object.
         :param angle: The new angle of the static object.
         """
-        for plot in self.plots:
-            xdata = plot.get_xdata() - np.array(self.position.x_center)
-            ydata = plot.get_ydata() - np.array(self.position.y_center)
-            xdata, ydata = rotate(xdata, ydata, self.position.angle)
-            xdata, ydata = rotate(xdata, ydata, -angle)
-            plot.set_xdata(xdata + x_center)
-            plot.set_ydata(ydata + y_center)
-
-        for fill in self.fills:
-            xy_data = fill.get_xy() - [self.position.x_center, self.position.y_center]
-            xy_data[:, 0], xy_data[:, 1] = rotate(xy_data[:, 0], xy_data[:, 1], self.position.angle)
-            xy_data[:, 0], xy_data[:, 1] = rotate(xy_data[:, 0], xy_data[:, 1], -angle)
-            xy_data[:, 0] += x_center
-            xy_data[:, 1] += y_center
+        position = self.position
+        x_old, y_old, angle_old = position.x_center, position.y_center, position.angle
+        if (x_center, y_center, angle) == (x_old, y_old, angle_old):
+            return
+
+        # Undoing the old pose and applying the new one is captured by a single affine
+        # transformation. The vertices of all artists are transformed in one go.
+        if angle == angle_old:
+            transform = Affine2D().translate(x_center - x_old, y_center - y_old)
+        else:
+            transform = (
+                Affine2D()
+                .translate(-x_old, -y_old)
+                .rotate(angle_old - angle)
+                .translate(x_center, y_center)
+            )
+        xy_datas = [np.column_stack((plot.get_xdata(), plot.get_ydata())) for plot in self.plots]
+        xy_datas += [fill.get_xy() for fill in self.fills]
+        for collection in self.collections:
+            if isinstance(collection, LineCollection):
+                xy_datas += collection.get_segments()
+            else:
+                # The paths of a polygon are closed automatically, so the closing vertex is dropped.
+                xy_datas += [np.asarray(path.vertices)[:-1] for path in collection.get_paths()]
+        if xy_datas:
+            splits = np.cumsum([len(xy_data) for xy_data in xy_datas[:-1]])
+            xy_datas = np.split(transform.transform(np.concatenate(xy_datas)), splits)
+        new_xy_datas = iter(xy_datas)
+        for plot, xy_data in zip(self.plots, new_xy_datas):
+            plot.set_data(xy_data[:, 0], xy_data[:, 1])
+        for fill, xy_data in zip(self.fills, new_xy_datas):
             fill.set_xy(xy_data)
+        for collection in self.collections:
+            collection.set_verts([next(new_xy_datas) for _ in collection.get_paths()])
 
         for text in self.texts:
             text.set_position((x_center, y_center))
 
-        self.position.x_center = x_center
-        self.position.y_center = y_center
-        self.position.angle = angle
+        position.x_center = x_center
+        position.y_center = y_center
+        position.angle = angle
 
     def change_color(
         self,
@@ -96,9 +230,13 @@ class StaticObject(ABC):
         if face_color is not None:
             for fill in self.fills:
                 fill.set_facecolor(face_color)
+            for collection in self.collections:
+                collection.set_facecolor(face_color)
         if edge_color is not None:
             for fill in self.fills:
                 fill.set_edgecolor(edge_color)
+            for collection in self.collections:
+                collection.set_edgecolor(edge_color)
             for plot in self.plots:
                 plot.set_color(edge_color)
 
@@ -133,25 +271,22 @@ class MaxSpeed(StaticObject):
         self.set_radius(axes)
         StaticObject.__init__(self, axes)
 
-        # Draw the sign
-        theta = np.linspace(0, 2 * np.pi, 40)
-        xouter = np.cos(theta) * self.options.outer_radius
-        youter = np.sin(theta) * self.options.outer_radius
-        xinner = np.cos(theta) * self.options.inner_radius
-        yinner = np.sin(theta) * self.options.inner_radius
+        # Draw the sign. The inner disk is drawn on top of the outer disk, both within a
+        # single collection.
+        cosines, sines = unit_circle(40)
         self.position = StaticObjectPosition()
-        self.fills = (
-            axes.fill(
-                xouter + self.position.x_center,
-                youter + self.position.y_center,
-                color=self.options.outer_color,
-            )[0],
-            axes.fill(
-                xinner + self.position.x_center,
-                yinner + self.position.y_center,
-                color=self.options.inner_color,
-            )[0],
-        )
+        disks = [
+            np.column_stack(
+                (
+                    cosines * radius + self.position.x_center,
+                    sines * radius + self.position.y_center,
+                )
+            )
+            for radius in (self.options.outer_radius, self.options.inner_radius)
+        ]
+        colors = [self.options.outer_color, self.options.inner_color]
+        self.collections = (PolyCollection(disks, facecolors=colors, edgecolors=colors),)
+        axes.add_collection(self.collections[0])
 
         # Show text
         if text is not None:
@@ -178,7 +313,8 @@ class MaxSpeed(StaticObject):
         :param axes: The axes that is used to plot the sign on.
         """
         if self.options.inner_radius is None and self.options.outer_radius is None:
-            self.options.outer_radius = np.diff(axes.get_xlim())[0] * 0.033
+            xmin, xmax = axes.get_xlim()
+            self.options.outer_radius = (xmax - xmin) * 0.033
             self.options.inner_radius = 0.8 * self.options.outer_radius
         elif self.options.inner_radius is None and self.options.outer_radius is not None:
             self.options.inner_radius = 0.8 * self.options.outer_radius
@@ -225,134 +361,18 @@ class TurnArrow(StaticObject):
         StaticObject.__init__(self, axes)
         self.direction = direction
 
-        # Get coordinates of the arrow
-        if self.direction in ("right", "left"):
-            xdata = [-0.3, 0.3, 0.12, 0.24, 0.42, 0.54, 0.54, 1.2, 0.54, 0.54, 0.3, 0.12, -0.12]
-            ydata = [
-                -0.5,
-                -0.5,
-                0.152,
-                0.174,
-                0.189,
-                0.189,
-                0.053,
-                0.242,
-                0.5,
-                0.28,
-                0.28,
-                0.265,
-                0.227,
-            ]
-            if self.direction == "left":
-                xdata = [-xdata_element for xdata_element in xdata]
-        elif self.direction == "leftright":
-            xdata = [
-                -0.3,
-                0.3,
-                0.12,
-                0.24,
-                0.42,
-                0.54,
-                0.54,
-                1.2,
-                0.54,
-                0.54,
-                0.3,
-                0.12,
-                -0.12,
-                -0.3,
-                -0.54,
-                -0.54,
-                -1.2,
-                -0.54,
-                -0.54,
-                -0.42,
-                -0.24,
-                -0.12,
-            ]
-            ydata = [
-                -0.5,
-                -0.5,
-                0.152,
-                0.174,
-                0.189,
-                0.189,
-                0.053,
-                0.242,
-                0.5,
-                0.28,
-                0.28,
-                0.265,
-                0.265,
-                0.28,
-                0.28,
-                0.5,
-                0.242,
-                0.053,
-                0.189,
-                0.189,
-                0.174,
-                0.152,
-            ]
-        elif self.direction in ("leftthrough", "throughright"):
-            xdata = [
-                0.3,
-                0.233,
-                0.433,
-                0.833,
-                0.9,
-                0.9,
-                1.3,
-                0.9,
-                0.9,
-                0.967,
-                0.433,
-                0.233,
-                0.167,
-                0.167,
-                0.5,
-                0,
-                -0.5,
-                -0.167,
-                -0.3,
-            ]
-            ydata = [
-                -0.5,
-                -0.102,
-                -0.078,
-                -0.063,
-                -0.063,
-                -0.133,
-                -0.023,
-                0.102,
-                0.023,
-                0.023,
-                0.016,
-                0,
-                0,
-                0.117,
-                0.117,
-                0.5,
-                0.117,
-                0.117,
-                -0.5,
-            ]
-            if self.direction == "leftthrough":
-                xdata = [-xdata_element for xdata_element in xdata]
-        else:
-            xdata = [-0.3, 0.3, 0.167, 0.5, 0, -0.5, -0.167]
-            ydata = [-0.5, -0.5, 0.105, 0.105, 0.5, 0.105, 0.105]
+        # Get coordinates of the arrow. Any other direction results in a 'through' arrow.
+        vertices = TURN_ARROW_VERTICES.get(str(self.direction), TURN_ARROW_VERTICES["through"])
 
         # Set width and height
-        xdata_array = np.concatenate((xdata, [xdata[0]])) * self.options.width
-        ydata_array = np.concatenate((ydata, [ydata[0]])) * self.options.length
+        xy_data = vertices * [self.options.width, self.options.length]
 
         # Plot the arrow
         self.position = StaticObjectPosition()
         self.fills = (
             axes.fill(
-                xdata_array + self.position.x_center,
-                ydata_array + self.position.y_center,
+                xy_data[:, 0] + self.position.x_center,
+                xy_data[:, 1] + self.position.y_center,
                 facecolor=self.options.face_color,
                 edgecolor=self.options.edge_color,
                 zorder=self.options.layer,
@@ -391,8 +411,8 @@ class Building(StaticObject):
             self.options.size_y = self.options.size
 
         if self.options.x_data is None:
-            self.options.x_data = np.array([1, 1, -1, -1]) * self.options.size_x / 2
-            self.options.y_data = np.array([1, -1, -1, 1]) * self.options.size_y / 2
+            self.options.x_data = _BUILDING_X * self.options.size_x
+            self.options.y_data = _BUILDING_Y * self.options.size_y
 
         fill_options: Dict[str, Union[Tuple[float, float, float], str]]
         fill_options = {"facecolor": self.options.face_color, "edgecolor": self.options.edge_color}
@@ -423,52 +443,69 @@ class Stripes(StaticObject):
         # Draw the rectangle.
         self.fills = (
             axes.fill(
-                np.array([-1, 1, 1, -1]) * self.options.width / 2,
-                np.array([1, 1, -1, -1]) * self.options.length / 2,
+                RECTANGLE_X * self.options.width,
+                RECTANGLE_Y * self.options.length,
                 facecolor=self.options.face_color,
                 edgecolor=None,
                 zorder=self.options.layer,
             )[0],
         )
-        w_stripe = (self.options.width + self.options.length) / self.options.nstripes
-        for i in range((self.options.nstripes + 1) // 2):
-            alphai, betai = 2 * i * w_stripe, (2 * i + 1) * w_stripe
-
-            xdata = [min(alphai, self.options.width)]
-            ydata = [alphai - xdata[0]]
-
-            if alphai < self.options.width < betai:
-                xdata.append(self.options.width)
-                ydata.append(0)
-
-            xdata.append(min(betai, self.options.width))
-            ydata.append(betai - xdata[-1])
-
-            if i < self.options.nstripes - 1:
-                ydata.append(min(betai, self.options.length))
-                xdata.append(betai - ydata[-1])
-
-            if alphai < self.options.length < betai:
-                xdata.append(0)
-                ydata.append(self.options.length)
-
-            if i > 0:
-                ydata.append(min(alphai, self.options.length))
-                xdata.append(alphai - ydata[-1])
-
-            self.fills += (
-                axes.fill(
-                    np.array(xdata) - self.options.width / 2,
-                    self.options.length / 2 - np.array(ydata),
-                    facecolor=self.options.face_color2,
-                    edgecolor=None,
-                    zorder=self.options.layer,
-                )[0],
+        # Each stripe has at most six corners, going counterclockwise starting at the top edge
+        # of the rectangle. All corners of all stripes are computed at once and the corners that
+        # a stripe does not have are masked out.
+        width, length = self.options.width, self.options.length
+        w_stripe = (width + length) / self.options.nstripes
+        i_stripe = np.arange((self.options.nstripes + 1) // 2)
+        alpha, beta = 2 * i_stripe * w_stripe, (2 * i_stripe + 1) * w_stripe
+        x_alpha, x_beta = np.minimum(alpha, width), np.minimum(beta, width)
+        y_alpha, y_beta = np.minimum(alpha, length), np.minimum(beta, length)
+        xdata = np.column_stack(
+            (
+                x_alpha,
+                np.full_like(alpha, width),
+                x_beta,
+                beta - y_beta,
+                np.zeros_like(alpha),
+                alpha - y_alpha,
+            )
+        )
+        ydata = np.column_stack(
+            (
+                alpha - x_alpha,
+                np.zeros_like(alpha),
+                beta - x_beta,
+                y_beta,
+                np.full_like(alpha, length),
+                y_alpha,
             )
+        )
+        has_corner = np.column_stack(
+            (
+                np.ones_like(i_stripe, dtype=bool),
+                (alpha < width) & (width < beta),
+                np.ones_like(i_stripe, dtype=bool),
+                i_stripe < self.options.nstripes - 1,
+                (alpha < length) & (length < beta),
+                i_stripe > 0,
+            )
+        )
+        corners = np.stack((xdata - width / 2, length / 2 - ydata), axis=-1)
+        stripes = [corner[mask] for corner, mask in zip(corners, has_corner)]
+
+        # Draw all stripes at once.
+        self.collections = (
+            PolyCollection(
+                stripes,
+                facecolors=self.options.face_color2,
+                edgecolors="none",
+                zorder=self.options.layer,
+            ),
+        )
+        axes.add_collection(self.collections[0])
         self.plots = (
             axes.plot(
-                np.array([-1, 1, 1, -1, -1]) * self.options.width / 2,
-                np.array([1, 1, -1, -1, 1]) * self.options.length / 2,
+                np.append(RECTANGLE_X, RECTANGLE_X[0]) * self.options.width,
+                np.append(RECTANGLE_Y, RECTANGLE_Y[0]) * self.options.length,
                 color=self.options.edge_color,
                 zorder=self.options.layer,
             )[0],
@@ -491,5 +528,4 @@ class Stripes(StaticObject):
         if edge_color is not None:
             self.plots[0].set_color(edge_color)
         if face_color2 is not None:
-            for fill in self.fills[1:]:
-                fill.set_facecolor(face_color2)
+            self.collections[0].set_facecolor(face_color2)
@@ -8,9 +8,12 @@ from typing import Optional, Tuple
 
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
+from matplotlib.transforms import Affine2D
 
 from .options import Options
-from .static_objects import StaticObject
+from .static_objects import RECTANGLE_X, RECTANGLE_Y, StaticObject
+from .utilities import unit_circle
 
 
 class TrafficLightStatus(Enum):
@@ -60,6 +63,8 @@ class TrafficLight(StaticObject):
         status (TrafficLightStatus): The status of the traffic light.
     """
 
+    collections: Tuple[LineCollection, ...]
+
     def __init__(self, axes: Axes, options: Optional[TrafficLightOptions] = None) -> None:
         """Create a traffic light object.
 
@@ -67,10 +72,10 @@ class TrafficLight(StaticObject):
         :param options: Any options for the traffic light, see TrafficLightOptions.
         """
         self.options = TrafficLightOptions() if options is None else options
-        self.axes = axes
         StaticObject.__init__(self, axes)
         if self.options.radius == 0:
-            self.options.radius = np.diff(axes.get_xlim())[0] * 0.005
+            xmin, xmax = axes.get_xlim()
+            self.options.radius = (xmax - xmin) * 0.005
         if self.options.width == 0:
             self.options.width = self.options.radius * 2.6
         if self.options.length == 0:
@@ -94,28 +99,18 @@ class TrafficLight(StaticObject):
 
         self.status = TrafficLightStatus.IDLE
         # Draw the rectangle.
-        x_data = np.array(
-            [
-                -self.options.width / 2,
-                self.options.width / 2,
-                self.options.width / 2,
-                -self.options.width / 2,
-            ]
-        )
-        y_data = np.array(
-            [
-                self.options.length / 2,
-                self.options.length / 2,
-                -self.options.length / 2,
-                -self.options.length / 2,
-            ]
+        self.fills = (
+            self.axes.fill(
+                RECTANGLE_X * self.options.width,
+                RECTANGLE_Y * self.options.length,
+                color=self.options.rectangle_color,
+            )[0],
         )
-        self.fills = (self.axes.fill(x_data, y_data, color=self.options.rectangle_color)[0],)
 
         # Draw the red, amber, and green signals.
-        theta = np.linspace(0, 2 * np.pi, 30)
-        x_data = self.options.radius * np.cos(theta)
-        y_data = self.options.radius * np.sin(theta)
+        cosines, sines = unit_circle(30)
+        x_data = self.options.radius * cosines
+        y_data = self.options.radius * sines
         if self.options.amber:
             self.fills += (
                 self.axes.fill(
@@ -136,10 +131,14 @@ class TrafficLight(StaticObject):
                 )[0],
             )
 
+        # The rays of the signal are drawn using a single collection that is hidden when idle. The
+        # caps are projecting, similar to the default of lines drawn with plot().
+        self.collections = (LineCollection([], visible=False, capstyle="projecting"),)
+        self.axes.add_collection(self.collections[0])
+
     def idle(self) -> None:
-        """Plot an idle traffic light and reposition it."""
-        self.plot_idle()
-        self.set_position()
+        """Show an idle traffic light."""
+        self.show_signal(TrafficLightStatus.IDLE)
 
     def set_position(self) -> None:
         """Set the position of the traffic light correctly.
@@ -162,8 +161,12 @@ class TrafficLight(StaticObject):
         for plot in self.plots:
             plot.remove()
             del plot
+        for collection in self.collections:
+            collection.remove()
+            del collection
         self.plots = ()
         self.fills = ()
+        self.collections = ()
         self.status = TrafficLightStatus.REMOVED
 
     def signal_data(self, signal: TrafficLightStatus) -> Tuple[np.ndarray, np.ndarray]:
@@ -172,15 +175,10 @@ class TrafficLight(StaticObject):
         :param signal: The signal to show.
         :return: x and y data of the signal.
         """
-        xdata = np.zeros((2, self.options.signal_lines))
-        ydata = np.array(np.zeros_like(xdata))
-        for i, theta in enumerate(
-            np.linspace(0, np.pi * 2, self.options.signal_lines, endpoint=False)
-        ):
-            xdata[0, i] = np.cos(theta) * self.options.signal_inner_radius
-            xdata[1, i] = np.cos(theta) * self.options.signal_outer_radius
-            ydata[0, i] = np.sin(theta) * self.options.signal_inner_radius
-            ydata[1, i] = np.sin(theta) * self.options.signal_outer_radius
+        cosines, sines = unit_circle(self.options.signal_lines, endpoint=False)
+        radii = np.array([[self.options.signal_inner_radius], [self.options.signal_outer_radius]])
+        xdata = radii * cosines
+        ydata = radii * sines
         if signal in (TrafficLightStatus.RED, TrafficLightStatus.GREEN):
             distance = self.options.inter_dist
             if not self.options.amber:
@@ -191,44 +189,59 @@ class TrafficLight(StaticObject):
                 ydata -= distance
         return xdata, ydata
 
+    def show_signal(self, signal: TrafficLightStatus) -> None:
+        """Show the signal by recoloring the lights and updating the rays of the signal.
+
+        The traffic light is only redrawn if it has been removed. Otherwise, the existing
+        lights and rays are updated.
+
+        :param signal: The signal to show (IDLE, RED, AMBER, or GREEN).
+        """
+        if self.status == TrafficLightStatus.REMOVED:
+            self.plot_idle()
+            self.set_position()
+        self.status = signal
+
+        # When idle, all lights are shown with their normal color.
+        lights = [(TrafficLightStatus.RED, self.options.red_color, self.options.red_idle_color)]
+        if self.options.amber:
+            lights.append(
+                (TrafficLightStatus.AMBER, self.options.amber_color, self.options.amber_idle_color)
+            )
+        lights.append(
+            (TrafficLightStatus.GREEN, self.options.green_color, self.options.green_idle_color)
+        )
+        for fill, (light, color, idle_color) in zip(self.fills[1:], lights):
+            fill.set_color(color if signal in (light, TrafficLightStatus.IDLE) else idle_color)
+
+        rays = self.collections[0]
+        if signal == TrafficLightStatus.IDLE:
+            rays.set_visible(False)
+            return
+        xdata, ydata = self.signal_data(signal)
+        xy_data = (
+            Affine2D()
+            .rotate(-self.position.angle)
+            .translate(self.position.x_center, self.position.y_center)
+            .transform(np.column_stack((xdata.T.ravel(), ydata.T.ravel())))
+        )
+        rays.set_segments(list(xy_data.reshape(-1, 2, 2)))
+        rays.set_color(next(color for light, color, _ in lights if light == signal))
+        rays.set_visible(True)
+
     def red(self) -> None:
         """Show red light signal."""
-        self.remove()
-        self.plot_idle()
-        self.status = TrafficLightStatus.RED
-        xdata, ydata = self.signal_data(self.status)
-        self.plots = (self.axes.plot(xdata, ydata, color=self.options.red_color)[0],)
-        if self.options.amber:
-            self.fills[2].set_color(self.options.amber_idle_color)
-            self.fills[3].set_color(self.options.green_idle_color)
-        else:
-            self.fills[2].set_color(self.options.green_idle_color)
-        self.set_position()
+        self.show_signal(TrafficLightStatus.RED)
 
     def amber(self) -> None:
         """Show amber light signal."""
         if not self.options.amber:
             raise NoAmberError
-        self.remove()
-        self.plot_idle()
-        self.status = TrafficLightStatus.AMBER
-        xdata, ydata = self.signal_data(self.status)
-        self.plots = (self.axes.plot(xdata, ydata, color=self.options.amber_color)[0],)
-        self.fills[1].set_color(self.options.red_idle_color)
-        self.fills[3].set_color(self.options.green_idle_color)
-        self.set_position()
+        self.show_signal(TrafficLightStatus.AMBER)
 
     def green(self) -> None:
         """Show green light signal."""
-        self.remove()
-        self.plot_idle()
-        self.status = TrafficLightStatus.GREEN
-        xdata, ydata = self.signal_data(self.status)
-        self.plots = (self.axes.plot(xdata, ydata, color=self.options.green_color)[0],)
-        self.fills[1].set_color(self.options.red_idle_color)
-        if self.options.amber:
-            self.fills[2].set_color(self.options.amber_idle_color)
-        self.set_position()
+        self.show_signal(TrafficLightStatus.GREEN)
 
     def set_status(self, status: TrafficLightStatus) -> None:
         """Set the status of the traffic light.
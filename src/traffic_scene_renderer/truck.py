@@ -7,11 +7,148 @@ from typing import Optional, Tuple, Union
 
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
+from matplotlib.transforms import Affine2D
 
 from .polygon import Polygon
-from .utilities import rotate
+from .static_objects import RECTANGLE_X, RECTANGLE_Y
 from .vehicle import Vehicle, VehicleOptions
 
+# The shape of the truck is drawn in pixel coordinates. These are the pixel coordinates of the
+# center of the truck and the width and length of the truck in pixels.
+_XOFFSET = 103
+_YOFFSET = 160.5
+_XSCALE = 170
+_YSCALE = 301
+
+
+def _normalize(
+    xdata: np.ndarray, ydata: np.ndarray, *, mirror: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Convert pixel coordinates to the coordinates of a truck with unit width and length.
+
+    :param xdata: The horizontal pixel coordinates.
+    :param ydata: The vertical pixel coordinates.
+    :param mirror: Whether to append the mirror image with respect to the center line.
+    :return: Read-only x-coordinates and y-coordinates, with the front of the truck at y>0.
+    """
+    if mirror:
+        xdata = np.concatenate((xdata, 2 * _XOFFSET - xdata[::-1]))
+        ydata = np.concatenate((ydata, ydata[::-1]))
+    xdata = (xdata - _XOFFSET) / _XSCALE
+    ydata = -(ydata - _YOFFSET) / _YSCALE
+    xdata.setflags(write=False)
+    ydata.setflags(write=False)
+    return xdata, ydata
+
+
+_BODY_PIXELS_X = np.array([103, 32, 32, 19, 17, 18, 21, 22, 25, 30, 38, 47, 63, 103])
+_BODY_PIXELS_Y = np.array([152, 152, 156, 156, 153, 86, 49, 38, 24, 18, 13, 11, 10, 10])
+_FUEL_TANK_PIXELS_X = np.array([28, 28, 65, 65])
+_FUEL_TANK_PIXELS_Y = [
+    np.array([171, 182, 182, 171]),
+    np.array([184, 203, 203, 184]),
+    np.array([205, 224, 224, 205]),
+    np.array([226, 237, 237, 226]),
+]
+_BLACK_PART_PIXELS_X = [np.array([21, 7, 7, 11, 22]), np.array([37, 37, 58, 58])]
+_BLACK_PART_PIXELS_Y = [np.array([49, 45, 41, 38, 38]), np.array([152, 168, 168, 152])]
+_ROOF_LINE_PIXELS_X = np.array([40, 42, 164, 166])
+_ROOF_LINE_PIXELS_Y = np.array([152, 106, 106, 152])
+_BACK_CONTOUR_PIXELS_X = np.array(
+    [
+        63,
+        63,
+        74,
+        74,
+        27,
+        27,
+        74,
+        74,
+        27,
+        27,
+        74,
+        74,
+        27,
+        27,
+        74,
+        74,
+        30,
+        28,
+        26,
+        26,
+        27,
+        30,
+        30,
+        70,
+        70,
+        73,
+        73,
+        104,
+    ]
+)
+_BACK_CONTOUR_PIXELS_Y = np.array(
+    [
+        152,
+        165,
+        165,
+        182,
+        182,
+        184,
+        184,
+        203,
+        203,
+        205,
+        205,
+        224,
+        224,
+        226,
+        226,
+        241,
+        241,
+        244,
+        252,
+        300,
+        304,
+        305,
+        311,
+        311,
+        307,
+        307,
+        314,
+        314,
+    ]
+)
+_HITCH_PIXELS_X = np.array([103, 102, 100, 99, 96, 94, 91, 89, 84, 80, 80, 83, 88, 93, 99, 103])
+_HITCH_PIXELS_Y = np.array(
+    [262, 263, 268, 277, 286, 288, 288, 286, 276, 262, 250, 241, 235, 232, 231, 231]
+)
+_BACK_PIXELS_X = np.concatenate(
+    (
+        _BACK_CONTOUR_PIXELS_X,
+        _HITCH_PIXELS_X,
+        np.array([103, 80, 80, 98, 98, 80, 80, 98, 98, 103, 103]),
+    )
+)
+_BACK_PIXELS_Y = np.concatenate(
+    (
+        _BACK_CONTOUR_PIXELS_Y,
+        _HITCH_PIXELS_Y,
+        np.array([228, 228, 205, 205, 194, 194, 170, 170, 228, 228, 152]),
+    )
+)
+
+# The (mirrored) shapes of a truck with unit width and length, computed once at import.
+_BODY = _normalize(_BODY_PIXELS_X, _BODY_PIXELS_Y, mirror=True)
+_FUEL_TANKS = [_normalize(_FUEL_TANK_PIXELS_X, ydata) for ydata in _FUEL_TANK_PIXELS_Y]
+_BLACK_PARTS = [
+    _normalize(xdata, ydata) for xdata, ydata in zip(_BLACK_PART_PIXELS_X, _BLACK_PART_PIXELS_Y)
+]
+_ROOF_LINE = _normalize(_ROOF_LINE_PIXELS_X, _ROOF_LINE_PIXELS_Y)
+_BACK_CONTOUR = _normalize(_BACK_CONTOUR_PIXELS_X, _BACK_CONTOUR_PIXELS_Y, mirror=True)
+_HITCH = _normalize(_HITCH_PIXELS_X, _HITCH_PIXELS_Y, mirror=True)
+_BACK = _normalize(_BACK_PIXELS_X, _BACK_PIXELS_Y, mirror=True)
+
 
 class TruckOptions(VehicleOptions):
     """The default values of the options of a truck.
@@ -82,253 +219,141 @@ class Truck(Vehicle):
 
     def plot_vehicle(self) -> None:
         """Plot the truck on the axes."""
-        # Plot the truck.
-        yoffset = 160.5
-        yscale = 301
-        xoffset = 103
-        xscale = 170
+        options = self.options
+        width, length = options.width, options.length
 
         # Fill with main color, mirror.
-        xdata = np.array([103, 32, 32, 19, 17, 18, 21, 22, 25, 30, 38, 47, 63, 103])
-        ydata = np.array([152, 152, 156, 156, 153, 86, 49, 38, 24, 18, 13, 11, 10, 10])
-        xdata = (np.concatenate((xdata, 2 * xoffset - np.flipud(xdata))) - xoffset) / xscale
-        ydata = (np.concatenate((ydata, np.flipud(ydata))) - yoffset) / yscale
         self.fills += (
             Polygon(
                 self.axes,
-                xdata * self.options.width,
-                -ydata * self.options.length,
-                facecolor=self.options.color,
-                edgecolor=self.options.edgecolor,
-                zorder=self.options.layer,
+                _BODY[0] * width,
+                _BODY[1] * length,
+                facecolor=options.color,
+                edgecolor=options.edgecolor,
+                zorder=options.layer,
             ),
         )
 
-        # Fill fuel tank, both sides.
-        xdata = (np.array([28, 28, 65, 65]) - xoffset) / xscale
-        ydatas = [
-            np.array([171, 182, 182, 171]),
-            np.array([184, 203, 203, 184]),
-            np.array([205, 224, 224, 205]),
-            np.array([226, 237, 237, 226]),
+        # Fill fuel tank, both sides, as a single collection.
+        fuel_tanks = [
+            np.column_stack((sign * xdata * width, ydata * length))
+            for xdata, ydata in _FUEL_TANKS
+            for sign in (1, -1)
         ]
-        for ydata in ydatas:
-            ydata_new = (ydata - yoffset) / yscale
-            self.fills += (
-                Polygon(
-                    self.axes,
-                    xdata * self.options.width,
-                    -ydata_new * self.options.length,
-                    facecolor=self.options.color,
-                    edgecolor=self.options.edgecolor,
-                    zorder=self.options.layer,
-                ),
-                Polygon(
-                    self.axes,
-                    -xdata * self.options.width,
-                    -ydata_new * self.options.length,
-                    facecolor=self.options.color,
-                    edgecolor=self.options.edgecolor,
-                    zorder=self.options.layer,
-                ),
-            )
-
-        # Fill mirror and other black (color2) part, both sides.
-        xdatas = [np.array([21, 7, 7, 11, 22]), np.array([37, 37, 58, 58])]
-        ydatas = [np.array([49, 45, 41, 38, 38]), np.array([152, 168, 168, 152])]
-        for xdata, ydata in zip(xdatas, ydatas):
-            xdata_new = (xdata - xoffset) / xscale
-            ydata_new = (ydata - yoffset) / yscale
-            self.fills += (
-                Polygon(
-                    self.axes,
-                    xdata_new * self.options.width,
-                    -ydata_new * self.options.length,
-                    facecolor=self.options.color2,
-                    edgecolor=self.options.edgecolor,
-                    linewidth=self.options.line_width,
-                    zorder=self.options.layer,
-                    fixed_color=True,
-                ),
-                Polygon(
-                    self.axes,
-                    -xdata_new * self.options.width,
-                    -ydata_new * self.options.length,
-                    facecolor=self.options.color2,
-                    edgecolor=self.options.edgecolor,
-                    linewidth=self.options.line_width,
-                    zorder=self.options.layer,
-                    fixed_color=True,
-                ),
-            )
 
-        # Draw a line on top of the truck.
-        xdata = (np.array([40, 42, 164, 166]) - xoffset) / xscale
-        ydata = (np.array([152, 106, 106, 152]) - yoffset) / yscale
-        self.plots += (
-            self.axes.plot(
-                xdata * self.options.width,
-                -ydata * self.options.length,
-                color=self.options.edgecolor,
-                linewidth=self.options.line_width,
-                zorder=self.options.layer,
-            )[0],
-        )
+        # Fill mirror and other black (color2) part, both sides, as a single collection.
+        black_parts = [
+            np.column_stack((sign * xdata * width, ydata * length))
+            for xdata, ydata in _BLACK_PARTS
+            for sign in (1, -1)
+        ]
 
-        # Draw the contour of the back of the truck, mirror.
-        xdata = np.array(
-            [
-                63,
-                63,
-                74,
-                74,
-                27,
-                27,
-                74,
-                74,
-                27,
-                27,
-                74,
-                74,
-                27,
-                27,
-                74,
-                74,
-                30,
-                28,
-                26,
-                26,
-                27,
-                30,
-                30,
-                70,
-                70,
-                73,
-                73,
-                104,
-            ]
-        )
-        ydata = np.array(
-            [
-                152,
-                165,
-                165,
-                182,
-                182,
-                184,
-                184,
-                203,
-                203,
-                205,
-                205,
-                224,
-                224,
-                226,
-                226,
-                241,
-                241,
-                244,
-                252,
-                300,
-                304,
-                305,
-                311,
-                311,
-                307,
-                307,
-                314,
-                314,
-            ]
+        # The black parts are stored separately, as their color is fixed (see change_color).
+        self._black_parts = PolyCollection(
+            black_parts,
+            facecolors=options.color2,
+            edgecolors=options.edgecolor,
+            linewidths=options.line_width,
+            zorder=options.layer,
         )
-        xdata3 = (np.concatenate((xdata, 2 * xoffset - np.flipud(xdata))) - xoffset) / xscale
-        ydata3 = (np.concatenate((ydata, np.flipud(ydata))) - yoffset) / yscale
-        self.plots += (
-            self.axes.plot(
-                xdata3 * self.options.width,
-                -ydata3 * self.options.length,
-                color=self.options.edgecolor,
-                linewidth=self.options.line_width,
-                zorder=self.options.layer,
-            )[0],
+        self.collections = (
+            PolyCollection(
+                fuel_tanks,
+                facecolors=options.color,
+                edgecolors=options.edgecolor,
+                zorder=options.layer,
+            ),
+            self._black_parts,
         )
+        for collection in self.collections:
+            self.axes.add_collection(collection)
+
+        # Draw a line on top of the truck and the contour of the back of the truck.
+        for xdata, ydata in (_ROOF_LINE, _BACK_CONTOUR):
+            self.plots += (
+                self.axes.plot(
+                    xdata * width,
+                    ydata * length,
+                    color=options.edgecolor,
+                    linewidth=options.line_width,
+                    zorder=options.layer,
+                )[0],
+            )
 
         # Draw part to which trailer could be attached (color3), mirror.
-        xdata2 = np.array([103, 102, 100, 99, 96, 94, 91, 89, 84, 80, 80, 83, 88, 93, 99, 103])
-        ydata2 = np.array(
-            [262, 263, 268, 277, 286, 288, 288, 286, 276, 262, 250, 241, 235, 232, 231, 231]
-        )
-        xdata3 = (np.concatenate((xdata2, 2 * xoffset - np.flipud(xdata2))) - xoffset) / xscale
-        ydata3 = (np.concatenate((ydata2, np.flipud(ydata2))) - yoffset) / yscale
         self.fills += (
             Polygon(
                 self.axes,
-                xdata3 * self.options.width,
-                -ydata3 * self.options.length,
-                facecolor=self.options.color3,
-                edgecolor=self.options.edgecolor,
-                linewidth=self.options.line_width,
-                zorder=self.options.layer,
+                _HITCH[0] * width,
+                _HITCH[1] * length,
+                facecolor=options.color3,
+                edgecolor=options.edgecolor,
+                linewidth=options.line_width,
+                zorder=options.layer,
                 fixed_color=True,
             ),
         )
 
         # Draw back part of the truck, twice.
-        xdata = np.concatenate(
-            (xdata, xdata2, np.array([103, 80, 80, 98, 98, 80, 80, 98, 98, 103, 103]))
-        )
-        ydata = np.concatenate(
-            (ydata, ydata2, np.array([228, 228, 205, 205, 194, 194, 170, 170, 228, 228, 152]))
-        )
-        xdata = (np.concatenate((xdata, 2 * xoffset - np.flipud(xdata))) - xoffset) / xscale
-        ydata = (np.concatenate((ydata, np.flipud(ydata))) - yoffset) / yscale
         self.fills += (
             Polygon(
                 self.axes,
-                xdata * self.options.width,
-                -ydata * self.options.length,
-                facecolor=self.options.color2,
+                _BACK[0] * width,
+                _BACK[1] * length,
+                facecolor=options.color2,
                 linewidth=0,
-                zorder=self.options.layer,
+                zorder=options.layer,
                 fixed_color=True,
             ),
         )
 
         # Plot the trailer.
-        if self.options.trailer:
-            y_truck = (
-                self.options.l_pivot_trailer
-                - self.options.l_pivot_truck
-                - self.options.l_trailer / 2
-            )
-            xdata = np.array([-1, 1, 1, -1]) * self.options.w_trailer / 2
-            ydata = np.array([1, 1, -1, -1]) * self.options.l_trailer / 2 + y_truck
+        if options.trailer:
+            y_truck = options.l_pivot_trailer - options.l_pivot_truck - options.l_trailer / 2
+            xdata = RECTANGLE_X * options.w_trailer
+            ydata = RECTANGLE_Y * options.l_trailer + y_truck
             self.fills += (
                 Polygon(
                     self.axes,
                     xdata,
                     ydata,
-                    facecolor=self.options.color,
-                    edgecolor=self.options.edgecolor,
-                    linewidth=self.options.line_width,
-                    zorder=self.options.layer + 1,
+                    facecolor=options.color,
+                    edgecolor=options.edgecolor,
+                    linewidth=options.line_width,
+                    zorder=options.layer + 1,
                 ),
             )
 
+    def change_color(
+        self,
+        face_color: Optional[Tuple[float, float, float]] = None,
+        edge_color: Optional[Tuple[float, float, float]] = None,
+    ) -> None:
+        """Change the colors of the filled areas and the plotted lines.
+
+        :param face_color: The new color of the filled area.
+        :param edge_color: The new color of the edge of the filled areas and the lines.
+        """
+        Vehicle.change_color(self, face_color, edge_color)
+
+        # The mirrors and other black (color2) parts have a fixed color, similar to the other
+        # color2 and color3 Polygons.
+        self._black_parts.set_facecolor(self.options.color2)
+        self._black_parts.set_edgecolor(self.options.edgecolor)
+
     def change_trailer_angle(self, angle: float) -> None:
         """Change the angle of the trailer.
 
         :param angle: The angle of the trailer wrt the truck.
         """
-        x_pivot = self.position.x_center - np.sin(self.position.angle) * self.options.l_pivot_truck
-        y_pivot = self.position.y_center - np.cos(self.position.angle) * self.options.l_pivot_truck
-        xy_data = self.fills[-1].get_xy() - [x_pivot, y_pivot]
-        xy_data[:, 0], xy_data[:, 1] = rotate(
-            xy_data[:, 0], xy_data[:, 1], self.position.angle + self.trailer_angle
-        )
-        xy_data[:, 0], xy_data[:, 1] = rotate(
-            xy_data[:, 0], xy_data[:, 1], -self.position.angle - angle
+        sine, cosine = self._get_sin_cos_angle()
+        x_pivot = self.position.x_center - sine * self.options.l_pivot_truck
+        y_pivot = self.position.y_center - cosine * self.options.l_pivot_truck
+        transform = (
+            Affine2D()
+            .translate(-x_pivot, -y_pivot)
+            .rotate(self.trailer_angle - angle)
+            .translate(x_pivot, y_pivot)
         )
-        xy_data[:, 0] += x_pivot
-        xy_data[:, 1] += y_pivot
-        self.fills[-1].set_xy(xy_data)
+        self.fills[-1].set_xy(transform.transform(self.fills[-1].get_xy()))
         self.trailer_angle = angle
@@ -3,10 +3,15 @@
 Author(s): Erwin de Gelder
 """
 
+import math
+from functools import lru_cache
 from typing import Optional, Tuple
 
 import numpy as np
-import utm  # Installation required (pip install utm)
+
+# For each sector of the hue, the indices of the red, green, and blue content in the tuple
+# (first color, second color, zero), see hsl2rgb.
+_HUE_SECTOR_PERMUTATIONS = ((0, 1, 2), (1, 0, 2), (2, 0, 1), (2, 1, 0), (1, 2, 0), (0, 2, 1))
 
 
 def wgs_to_utm(
@@ -14,25 +19,38 @@ def wgs_to_utm(
 ) -> Tuple[np.ndarray, Optional[int], str]:
     """Convert WGS coordinates to UTM coordinates, such that zone is similar.
 
+    All points are converted with the zone number and the zone letter of the first point (or with
+    force_zone_number, if provided). Hence, the result is one continuous coordinate system, also
+    when the points cross a zone boundary or the equator. For example, if the first point is on the
+    northern hemisphere, points on the southern hemisphere get a negative northing (instead of a
+    northing with the false northing of 10000 km that they would get on their own).
+
     :param points_wgs: N-by-2 array containing N lat-lon coordinates.
     :param force_zone_number: Zone number to be used. Set to none if zone number needs to be
                               determined by first datapoint (default: None).
     :return: A tuple with a N-by-2 array containing N easting-northing coordinates, an integer
              of the zone used for transformation, and the character of the zone.
     """
-    n_points = points_wgs.shape[0]
-    points_utm = np.empty((n_points, 2))
-    zone_char = "U"  # Make sure it is defined
-
-    for i in range(n_points):
-        point_utm = utm.from_latlon(
-            points_wgs[i, 0], points_wgs[i, 1], force_zone_number=force_zone_number
-        )
-        points_utm[i, 0] = point_utm[0]
-        points_utm[i, 1] = point_utm[1]
-        if i == 0:
-            force_zone_number = point_utm[2]
-            zone_char = point_utm[3]
+    # utm is only imported when needed, such that importing this package stays cheap.
+    import utm  # noqa: PLC0415  # Installation required (pip install utm)
+
+    if points_wgs.shape[0] == 0:
+        return np.empty((0, 2)), force_zone_number, "U"
+
+    # The zone is determined by the first datapoint, after which all points are converted at once.
+    easting, northing, force_zone_number, zone_char = utm.from_latlon(
+        points_wgs[0, 0], points_wgs[0, 1], force_zone_number=force_zone_number
+    )
+    if points_wgs.shape[0] == 1:
+        # A single point (e.g., a Vertex) is already converted while determining the zone.
+        return np.array([[easting, northing]]), force_zone_number, zone_char
+    eastings, northings, _, _ = utm.from_latlon(
+        points_wgs[:, 0],
+        points_wgs[:, 1],
+        force_zone_number=force_zone_number,
+        force_zone_letter=zone_char,
+    )
+    points_utm = np.column_stack((eastings, northings))
 
     return points_utm, force_zone_number, zone_char
 
@@ -45,11 +63,29 @@ def rotate(x_data: np.ndarray, y_data: np.ndarray, angle: float) -> Tuple[np.nda
     :param angle: The rotation angle.
     :return: A tuple containing the x-coordinates and the y-coordinates of the rotated data.
     """
-    x_new = np.cos(angle) * x_data - np.sin(angle) * y_data
-    y_new = np.sin(angle) * x_data + np.cos(angle) * y_data
+    cosine, sine = math.cos(angle), math.sin(angle)
+    x_new = cosine * x_data - sine * y_data
+    y_new = sine * x_data + cosine * y_data
     return x_new, y_new
 
 
+@lru_cache(maxsize=None)
+def unit_circle(n_points: int, *, endpoint: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+    """Get the cosines and sines of angles that are equally spaced on the interval [0, 2 pi].
+
+    The result is cached, so the returned arrays are read-only.
+
+    :param n_points: The number of angles.
+    :param endpoint: Whether 2 pi is included, as with np.linspace (default: True).
+    :return: A tuple containing the cosines and the sines of the angles.
+    """
+    theta = np.linspace(0, 2 * np.pi, n_points, endpoint=endpoint)
+    cosines, sines = np.cos(theta), np.sin(theta)
+    cosines.setflags(write=False)
+    sines.setflags(write=False)
+    return cosines, sines
+
+
 def rgb2hsl(red: float, green: float, blue: float) -> Tuple[float, float, float]:
     """Convert RGB color format to HSL color format.
 
@@ -89,20 +125,9 @@ def hsl2rgb(hue: float, saturation: float, luminance: float) -> Tuple[float, flo
     second_color = first_color * (1 - abs((6 * hue % 2) - 1))
     mean_color = luminance - first_color / 2
 
-    if hue < 1 / 6:
-        red, green, blue = first_color, second_color, 0.0
-    elif hue < 1 / 3:
-        red, green, blue = second_color, first_color, 0.0
-    elif hue < 1 / 2:
-        red, green, blue = 0.0, first_color, second_color
-    elif hue < 2 / 3:
-        red, green, blue = 0.0, second_color, first_color
-    elif hue < 5 / 6:
-        red, green, blue = second_color, 0.0, first_color
-    else:
-        red, green, blue = first_color, 0.0, second_color
-
-    red += mean_color
-    green += mean_color
-    blue += mean_color
+    # Depending on the sector (of 60 degrees) of the hue, the red, green, and blue content are a
+    # permutation of the first color, the second color, and zero.
+    sector = min(max(int(6 * hue), 0), 5)
+    colors = (first_color, second_color, 0.0)
+    red, green, blue = (colors[i] + mean_color for i in _HUE_SECTOR_PERMUTATIONS[sector])
     return red, green, blue
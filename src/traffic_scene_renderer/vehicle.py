@@ -3,11 +3,13 @@
 Author(s): Erwin de Gelder
 """
 
+import math
 from abc import abstractmethod
 from typing import Optional, Tuple
 
 import numpy as np
 from matplotlib.axes import Axes
+from matplotlib.collections import PolyCollection
 
 from .options import Options
 from .path_follower import PathFollower
@@ -54,6 +56,8 @@ class Vehicle(StaticObject):
     Attributes:
         options (CarOptions): All options. For a detailed description, see above.
         is_braking (bool): Whether the car is braking or not.
+        skid_marks (PolyCollection): The skid marks that show that the vehicle is braking, or None
+            if the vehicle has not braked yet.
         axes (Axes): The axes that is used for plotting.
         path_follower (PathFollower): Optional object, used when vehicle needs to follow a path.
     """
@@ -72,8 +76,9 @@ class Vehicle(StaticObject):
         """
         self.options = VehicleOptions() if options is None else options
         self.is_braking = False
-        self.axes = axes
+        self.skid_marks: Optional[PolyCollection] = None
         StaticObject.__init__(self, axes)
+        self._sin_cos_angle = (0.0, 0.0, 1.0)
 
         # Plot the vehicle.
         self.plot_vehicle()
@@ -96,33 +101,48 @@ class Vehicle(StaticObject):
     def plot_vehicle(self) -> None:
         """Plot the vehicle on the axes."""
 
+    def _get_sin_cos_angle(self) -> Tuple[float, float]:
+        """Return the sine and cosine of the angle of the vehicle.
+
+        The sine and cosine are stored together with the angle, such that they are only evaluated
+        again if the angle of the vehicle has changed (also if self.position.angle is set directly).
+
+        :return: A tuple with the sine and the cosine of the angle.
+        """
+        angle, sine, cosine = self._sin_cos_angle
+        if angle != self.position.angle:
+            angle = self.position.angle
+            sine, cosine = math.sin(angle), math.cos(angle)
+            self._sin_cos_angle = (angle, sine, cosine)
+        return sine, cosine
+
     def get_front_x(self) -> float:
         """Return the x-coordinate of the front of the vehicle.
 
         :return: The x-coordinate of the front of the vehicle.
         """
-        return self.position.x_center + self.options.length * np.sin(self.position.angle) / 2
+        return self.position.x_center + self.options.length * self._get_sin_cos_angle()[0] / 2
 
     def get_rear_x(self) -> float:
         """Return the x-coordinate of the rear of the vehicle.
 
         :return: The x-coordinate of the front of the vehicle.
         """
-        return self.position.x_center - self.options.length * np.sin(self.position.angle) / 2
+        return self.position.x_center - self.options.length * self._get_sin_cos_angle()[0] / 2
 
     def get_front_y(self) -> float:
         """Return the y-coordinate of the front of the vehicle.
 
         :return: The y-coordinate of the front of the vehicle.
         """
-        return self.position.y_center + self.options.length * np.cos(self.position.angle) / 2
+        return self.position.y_center + self.options.length * self._get_sin_cos_angle()[1] / 2
 
     def get_rear_y(self) -> float:
         """Return the y-coordinate of the front of the vehicle.
 
         :return: The y-coordinate of the front of the vehicle.
         """
-        return self.position.y_center - self.options.length * np.cos(self.position.angle) / 2
+        return self.position.y_center - self.options.length * self._get_sin_cos_angle()[1] / 2
 
     def set_front_xy(self, x_front: float, y_front: float, angle: float = 0) -> None:
         """Set position of vehicle such that its front is at (x, y) with provided angle.
@@ -158,29 +178,33 @@ class Vehicle(StaticObject):
             xmax = 0.45 * self.options.width
             ymin = 0
             ymax = -0.5 * self.options.length - length
-            self.fills += (
-                self.axes.fill(
-                    [xmin, xmin, xmax, xmax],
-                    [ymin, ymax, ymax, ymin],
-                    "k",
-                    zorder=self.options.layer - 1,
-                )[0],
-                self.axes.fill(
-                    [-xmin, -xmin, -xmax, -xmax],
-                    [ymin, ymax, ymax, ymin],
-                    "k",
-                    zorder=self.options.layer - 1,
-                )[0],
-            )
+            skid_marks = [
+                np.array(
+                    [
+                        [xsign * xmin, ymin],
+                        [xsign * xmin, ymax],
+                        [xsign * xmax, ymax],
+                        [xsign * xmax, ymin],
+                    ]
+                )
+                for xsign in (1, -1)
+            ]
+            if self.skid_marks is None:
+                # The skid marks are created once and hidden when the vehicle stops braking.
+                self.skid_marks = PolyCollection(
+                    skid_marks, facecolors="k", edgecolors="none", zorder=self.options.layer - 1
+                )
+                self.axes.add_collection(self.skid_marks)
+                self.collections += (self.skid_marks,)
+            else:
+                self.skid_marks.set_verts(skid_marks)
+                self.skid_marks.set_facecolor("k")
+                self.skid_marks.set_visible(True)
             self.is_braking = True
             self.change_pos(x_center, y_center, angle)
 
     def stop_braking(self) -> None:
         """Remove the skid mark (if any) that shows that a vehicle is braking."""
-        if self.is_braking:
-            removes = self.fills[-2:]
-            self.fills = self.fills[:-2]
-            for remove in removes:
-                remove.remove()
-                del remove
+        if self.is_braking and self.skid_marks is not None:
+            self.skid_marks.set_visible(False)
             self.is_braking = False
@@ -6,11 +6,23 @@ Author(s): Erwin de Gelder
 from typing import List, Optional, Tuple
 
 import numpy as np
+import numpy.typing as npt
 
 from .options import Options
 from .utilities import wgs_to_utm
 
 
+class InvalidVertexDataError(Exception):
+    """Error to be raised in case the data for generating vertices is not N-by-2."""
+
+    def __init__(self, shape: Tuple[int, ...]) -> None:
+        """Description of error.
+
+        :param shape: The shape of the provided data.
+        """
+        super().__init__(f"Data for vertices should be N-by-2, but has shape {shape}.")
+
+
 class VertexOptions(Options):
     """The default options for a vertex."""
 
@@ -29,6 +41,8 @@ class Vertex:
                            the latlon data.
     """
 
+    __slots__ = ("idx", "options", "xcoordinate", "ycoordinate")
+
     def __init__(
         self, idx: int, xdata: float, ydata: float, options: Optional[VertexOptions] = None
     ) -> None:
@@ -62,13 +76,44 @@ class Vertex:
         self.options.zonenumber = utm[1]
         return utm[0][0, 0], utm[0][0, 1]
 
-    def get_xy(self) -> List:
+    def get_xy(self) -> Tuple[float, float]:
         """Get the (x, y)-coordinate of this vertex.
 
-        :return: The (x, y) coordinate as a list of two numbers.
+        :return: The (x, y) coordinate as a tuple of two numbers.
         """
-        return [self.xcoordinate, self.ycoordinate]
+        return self.xcoordinate, self.ycoordinate
 
     def __str__(self) -> str:
         """Return a string with the ID, x-coordinate, and y-coordinate of the vertex."""
         return f"Vertex[ID={self.idx:d}, x={self.xcoordinate:.2f}, y={self.ycoordinate:.2f}]"
+
+
+def generate_vertices(
+    xy_data: npt.ArrayLike, options: Optional[VertexOptions] = None, idx_start: int = 0
+) -> List[Vertex]:
+    """Create a vertex for each of the provided points.
+
+    In case of latlon data, all points are transformed with a single call to wgs_to_utm, instead of
+    one transformation per vertex. The provided options are not changed; each vertex gets its own
+    options with the zone number that is used for the transformation.
+
+    :param xy_data: N-by-2 array (or nested list) containing the (x, y) coordinates (or latlon
+                    coordinates).
+    :param options: options, such as latlon and zonenumber, that apply to all vertices.
+    :param idx_start: Index of the first vertex. The other vertices are numbered consecutively.
+    :return: A list with the N vertices.
+    """
+    if options is None:
+        options = VertexOptions()
+    points = np.asarray(xy_data, dtype=np.float64)
+    if points.ndim != 2 or points.shape[1] != 2:  # noqa: PLR2004
+        raise InvalidVertexDataError(points.shape)
+    zonenumber = options.zonenumber
+    if options.latlon:
+        points, zonenumber, _ = wgs_to_utm(points, force_zone_number=zonenumber)
+    # Iterating over a list of Python floats is faster than iterating over the NumPy array.
+    # The coordinates are already transformed, so the vertices must not transform them again.
+    return [
+        Vertex(idx, xdata, ydata, VertexOptions(zonenumber=zonenumber))
+        for idx, (xdata, ydata) in enumerate(points.tolist(), start=idx_start)
+    ]
@@ -4,6 +4,7 @@ Author(s): Erwin de Gelder
 """
 
 import copy
+import math
 import warnings
 from typing import List, Optional, Tuple, Union
 
@@ -254,13 +255,16 @@ class Way:
         :param index: index of vertex that belong to new way.
         :return: way that is cut off.
         """
-        way = copy.deepcopy(self)
+        # Only the options and parameters are copied; the vertices are shared with this way.
+        way = copy.copy(self)
+        way.options = copy.deepcopy(self.options)
+        way.parms = copy.deepcopy(self.parms)
+        way.vertices = self.vertices[index:]
         self.vertices = self.vertices[: index + 1]
-        way.vertices = way.vertices[index:]
+        way.ivs = self.ivs[index:]
         self.ivs = self.ivs[: index + 1]
-        way.ivs = way.ivs[index:]
+        way.parms.offset = self.parms.offset[index:]
         self.parms.offset = self.parms.offset[: index + 1]
-        way.parms.offset = way.parms.offset[index:]
         return way
 
     def insert_vertex(self, vertex: Vertex, index: int) -> Tuple[bool, bool]:
@@ -280,13 +284,12 @@ class Way:
             raise IndexVertexError(index, len(self.ivs) - 1)
         self.vertices.insert(index, vertex)
         self.ivs.insert(index, vertex.idx)
-        dist1 = np.hypot(
-            self.vertices[index - 1].xcoordinate - self.vertices[index].xcoordinate,
-            self.vertices[index - 1].ycoordinate - self.vertices[index].ycoordinate,
+        previous, following = self.vertices[index - 1], self.vertices[index + 1]
+        dist1 = math.hypot(
+            previous.xcoordinate - vertex.xcoordinate, previous.ycoordinate - vertex.ycoordinate
         )
-        dist2 = np.hypot(
-            self.vertices[index].xcoordinate - self.vertices[index + 1].xcoordinate,
-            self.vertices[index].ycoordinate - self.vertices[index + 1].ycoordinate,
+        dist2 = math.hypot(
+            vertex.xcoordinate - following.xcoordinate, vertex.ycoordinate - following.ycoordinate
         )
         self.parms.offset.insert(
             index,
@@ -377,8 +380,11 @@ class Way:
         Note that corresponding crossings need to be processed before processing the road.
         """
         xy_data = self.get_xy()
-        xy_left = apply_offset(xy_data, self.parms.hwidth)
-        xy_right = apply_offset(xy_data, -self.parms.hwidth)
+        # Both sides of the road and all lane lines are shifted along the same directions, so
+        # compute these once.
+        directions = offset_directions(xy_data)
+        xy_shift = self.parms.hwidth * directions
+        xy_left, xy_right = xy_data + xy_shift, xy_data - xy_shift
         self.parms.left.x_data, self.parms.left.y_data = xy_left[:, 0], xy_left[:, 1]
         self.parms.right.x_data, self.parms.right.y_data = xy_right[:, 0], xy_right[:, 1]
 
@@ -402,9 +408,11 @@ class Way:
         ):
             self.parms.plot.lines = []  # Empty list, even if process() is called again.
             for ilane in range(1, self.options.nlanes):
-                self.generate_lane_lines(ilane, xy_data)
+                self.generate_lane_lines(ilane, xy_data, directions)
 
-    def generate_lane_lines(self, ilane: int, xy_data: np.ndarray) -> None:
+    def generate_lane_lines(
+        self, ilane: int, xy_data: np.ndarray, directions: Optional[np.ndarray] = None
+    ) -> None:
         """Compute the coordinates of the line markers of a specific lane.
 
         The start and the end of road will have a line of half the specified length, e.g.
@@ -413,9 +421,13 @@ class Way:
 
         :param ilane: Index of the lane, ranging from 1 to the number of lanes minus 1.
         :param xy_data: (x,y) data of the lane, obtained using self.get_xy().
+        :param directions: Offset directions of xy_data, obtained using offset_directions(). If
+                           not provided, they will be computed.
         """
-        self.parms.plot.xyline = apply_offset(
-            xy_data, self.options.lanewidth * (ilane - self.options.nlanes / 2)
+        if directions is None:
+            directions = offset_directions(xy_data)
+        self.parms.plot.xyline = (
+            xy_data + self.options.lanewidth * (ilane - self.options.nlanes / 2) * directions
         )
         self.parms.plot.lengths = np.hypot(
             np.diff(self.parms.plot.xyline[:, 0]), np.diff(self.parms.plot.xyline[:, 1])
@@ -424,25 +436,28 @@ class Way:
         nlines = np.round(total_length / self.options.line_interval).astype(int) + 1
         interval_ratio = total_length / ((nlines - 1) * self.options.line_interval)
 
-        # Store line in array: [e0, n0, e1, n1] (e=easting, n=northing)
-        line = [self.parms.plot.xyline[0, 0], self.parms.plot.xyline[0, 1], 0, 0]
+        # Each line is stored as [e0, n0, e1, n1] (e=easting, n=northing).
+        easting, northing = self.parms.plot.xyline[0, 0], self.parms.plot.xyline[0, 1]
+        lines = self.parms.plot.lines
+        line_step = self.options.line_length * interval_ratio
+        gap_step = (self.options.line_interval - self.options.line_length) * interval_ratio
         distance = 0.0  # Distance from starting point
         self.parms.plot.i_interval = 0
         for i in range(nlines):
             # Compute end point of line
             if i in (0, nlines - 1):
-                distance += self.options.line_length * interval_ratio / 2
+                distance += line_step / 2
             else:
-                distance += self.options.line_length * interval_ratio
+                distance += line_step
 
-            line[2], line[3], distance = self.point_on_line(distance)
-            self.parms.plot.lines.append(line.copy())
+            easting_end, northing_end, distance = self.point_on_line(distance)
+            lines.append([easting, northing, easting_end, northing_end])
 
             # Compute starting point of next line
             if i == nlines - 1:  # No need to do this when there is no next line
                 break
-            distance += (self.options.line_interval - self.options.line_length) * interval_ratio
-            line[0], line[1], distance = self.point_on_line(distance)
+            distance += gap_step
+            easting, northing, distance = self.point_on_line(distance)
 
     def point_on_line(self, distance: float) -> Tuple[float, float, float]:
         """Compute the point on the line that is a specified distance away from the start.
@@ -457,20 +472,17 @@ class Way:
         :return: The easting and northing position of the new point on the line and the updated
                  distance.
         """
-        while distance > self.parms.plot.lengths[self.parms.plot.i_interval]:
-            if self.parms.plot.i_interval + 1 == len(self.parms.plot.lengths):
+        lengths, xyline = self.parms.plot.lengths, self.parms.plot.xyline
+        i_interval = self.parms.plot.i_interval
+        while distance > lengths[i_interval]:
+            if i_interval + 1 == len(lengths):
                 break
-            distance -= self.parms.plot.lengths[self.parms.plot.i_interval]
-            self.parms.plot.i_interval += 1
-        d_scaled = distance / self.parms.plot.lengths[self.parms.plot.i_interval]
-        easting = (
-            self.parms.plot.xyline[self.parms.plot.i_interval, 0] * (1 - d_scaled)
-            + self.parms.plot.xyline[self.parms.plot.i_interval + 1, 0] * d_scaled
-        )
-        northing = (
-            self.parms.plot.xyline[self.parms.plot.i_interval, 1] * (1 - d_scaled)
-            + self.parms.plot.xyline[self.parms.plot.i_interval + 1, 1] * d_scaled
-        )
+            distance -= lengths[i_interval]
+            i_interval += 1
+        self.parms.plot.i_interval = i_interval
+        d_scaled = distance / lengths[i_interval]
+        easting = xyline[i_interval, 0] * (1 - d_scaled) + xyline[i_interval + 1, 0] * d_scaled
+        northing = xyline[i_interval, 1] * (1 - d_scaled) + xyline[i_interval + 1, 1] * d_scaled
         return easting, northing, distance
 
     def apply_offset(self, offset: Union[float, List[float]]) -> None:
@@ -485,15 +497,10 @@ class Way:
         """
         if isinstance(offset, List):
             if len(offset) == 2:  # noqa: PLR2004
-                xy_data = [[vertex.xcoordinate, vertex.ycoordinate] for vertex in self.vertices]
-                distance = np.array(
-                    [
-                        np.hypot(
-                            xy_data[i][0] - xy_data[i - 1][0], xy_data[i][1] - xy_data[i - 1][1]
-                        )
-                        for i in range(1, len(xy_data))
-                    ]
+                xy_data = np.array(
+                    [[vertex.xcoordinate, vertex.ycoordinate] for vertex in self.vertices]
                 )
+                distance = np.hypot(np.diff(xy_data[:, 0]), np.diff(xy_data[:, 1]))
                 cumlative_dist = np.concatenate(([0], np.cumsum(distance)))
                 new_offset = offset[0] + cumlative_dist / cumlative_dist[-1] * (
                     offset[1] - offset[0]
@@ -655,40 +662,49 @@ def apply_offset(xy_data: np.ndarray, offset: Union[float, List[float]]) -> np.n
                    - A list of N floats. In this case, node i will have an offset of 'offset[i]'.
     :return: N-by-2 array with new (x,y)-coordinates.
     """
+    # Without any offset (e.g., a way whose offsets are never set), the line stays the same.
+    if not np.any(offset):
+        return xy_data.copy()
+
+    # A single offset is the same for all nodes, so it can be applied directly.
+    if not isinstance(offset, list):
+        return xy_data + offset * offset_directions(xy_data)
+
     # Determine the offsets, such that it is a list with N floats.
-    if isinstance(offset, list):
-        if len(offset) == 2:  # noqa: PLR2004
-            distances = np.array(
-                [
-                    np.hypot(xy_data[i, 0] - xy_data[i - 1, 0], xy_data[i, 1] - xy_data[i - 1, 1])
-                    for i in range(1, xy_data.shape[0])
-                ]
-            )
-            cumulative_dist = np.concatenate(([0], np.cumsum(distances)))
-            off = offset[0] + cumulative_dist / cumulative_dist[-1] * (offset[1] - offset[0])
-        else:
-            off = offset
+    if len(offset) == 2:  # noqa: PLR2004
+        distances = np.hypot(np.diff(xy_data[:, 0]), np.diff(xy_data[:, 1]))
+        cumulative_dist = np.concatenate(([0], np.cumsum(distances)))
+        off = offset[0] + cumulative_dist / cumulative_dist[-1] * (offset[1] - offset[0])
     else:
-        off = np.ones(xy_data.shape[0]) * offset
+        off = offset
+
+    return xy_data + offset_directions(xy_data) * np.reshape(off, (-1, 1))
 
-    direction = np.zeros_like(xy_data)
-    xy_new = np.zeros_like(xy_data)
-    for i in range(xy_data.shape[0]):
-        direction[i, :] = xy_data[max(i, 1), :] - xy_data[max(i - 1, 0), :]
-        direction[i, :] /= np.sqrt(np.dot(direction[i, :], direction[i, :]))
+
+def offset_directions(xy_data: np.ndarray) -> np.ndarray:
+    """Compute the direction in which each point of a line is moved by a unit offset.
+
+    The result only depends on the geometry of the line, so it can be reused for several offsets.
+
+    :param xy_data: N-by-2 array with (x,y)-coordinates.
+    :return: N-by-2 array with the displacement of each point for an offset of 1 (to the right).
+    """
+    # The direction at a node is the direction of the section towards that node. The first node
+    # gets the direction of the first section.
+    deltas = np.diff(xy_data, axis=0)
+    direction = np.concatenate((deltas[:1], deltas))
+    direction /= np.hypot(direction[:, 0], direction[:, 1])[:, np.newaxis]
 
     # Compute the angle (alpha) between two different sections. We need the tan(alpha/2),
     # which is computed using the formula tan(alpha/2) = sqrt(tan_halpha_squared), with
     # tan_halpha_squared = (1-cos(alpha)) / (1+cos(alpha)).
-    cosines = np.concatenate((np.sum(direction[:-1, :] * direction[1:, :], axis=1), [1]))
+    # The last node has no next section, so there is no angle and no correction (extra=0).
+    cosines = np.sum(direction[:-1, :] * direction[1:, :], axis=1)
     tan_halpha_squared = (1 - cosines) / (1 + cosines)  # It is assumed that cosines is not -1 !
-    tan_halpha_squared[tan_halpha_squared < 0] = 0
-    sign = np.concatenate(
-        (np.sign(direction[:-1, 1] * direction[1:, 0] - direction[:-1, 0] * direction[1:, 1]), [1])
-    )
-    extra = np.sqrt(tan_halpha_squared) * sign
+    sign = np.sign(direction[:-1, 1] * direction[1:, 0] - direction[:-1, 0] * direction[1:, 1])
+    extra = np.zeros(direction.shape[0])
+    extra[:-1] = np.sqrt(np.maximum(tan_halpha_squared, 0)) * sign
 
-    # Apply offset
-    xy_new[:, 0] = xy_data[:, 0] + (direction[:, 0] * extra - direction[:, 1]) * off
-    xy_new[:, 1] = xy_data[:, 1] + (direction[:, 1] * extra + direction[:, 0]) * off
-    return xy_new
+    return np.column_stack(
+        (direction[:, 0] * extra - direction[:, 1], direction[:, 1] * extra + direction[:, 0])
+    )
@@ -46,14 +46,9 @@ def test_cars_transparent() -> None:
 
 def test_invalid_car_type_error() -> None:
     fig, axes = plt.subplots()
-    try:
+    with pytest.raises(InvalidCarTypeError):
         Car(axes, CarOptions(fill=False, icar=5))
-    except InvalidCarTypeError:
-        pass
-    else:
-        pytest.fail("InvalidCarTypeError should be raised.")
-    finally:
-        plt.close(fig)
+    plt.close(fig)
 
 
 def test_car_change_color() -> None:
@@ -83,6 +78,18 @@ def test_car_set_front_xy() -> None:
     plt.close(fig)
 
 
+def test_car_get_coordinates_after_setting_angle() -> None:
+    fig, axes = plt.subplots()
+    car = Car(axes, CarOptions(length=2))
+    car.change_pos(1, 1, np.pi / 2)
+    assert car.get_front_x() == pytest.approx(2.0)
+    # Setting the angle directly should not give a stale front or rear.
+    car.position.angle = 0
+    assert (car.get_front_x(), car.get_front_y()) == (1.0, 2.0)
+    assert (car.get_rear_x(), car.get_rear_y()) == (1.0, 0.0)
+    plt.close(fig)
+
+
 def test_car_braking() -> None:
     fig, axes = plt.subplots()
     axes.set_xlim(-3, 3)
@@ -101,17 +108,41 @@ def test_car_braking() -> None:
     save_fig(fig, axes, Path("car") / "braking_car.png", 3)
 
 
+def test_car_braking_reuses_skid_marks() -> None:
+    fig, axes = plt.subplots()
+    car = Car(axes, CarOptions(width=2, length=4))
+    car.start_braking(2)
+    skid_marks = car.skid_marks
+    assert skid_marks is not None
+    assert skid_marks.get_visible()
+    n_collections = len(axes.collections)
+    np.testing.assert_allclose(
+        np.asarray(skid_marks.get_paths()[0].vertices)[:4],
+        [[0.6, 0], [0.6, -4], [0.9, -4], [0.9, 0]],
+    )
+
+    car.stop_braking()
+    assert not skid_marks.get_visible()
+
+    car.change_pos(1, 0)
+    car.start_braking(1)
+    assert car.skid_marks is skid_marks
+    assert skid_marks.get_visible()
+    assert len(axes.collections) == n_collections
+    assert car.collections.count(skid_marks) == 1
+    np.testing.assert_allclose(
+        np.asarray(skid_marks.get_paths()[0].vertices)[:4],
+        [[1.6, 0], [1.6, -3], [1.9, -3], [1.9, 0]],
+    )
+    plt.close(fig)
+
+
 def test_move_vehicle_no_path_follower_defined_error() -> None:
     fig, axes = plt.subplots()
     car = Car(axes)
-    try:
+    with pytest.raises(MoveVehicleNoPathFollowerDefinedError):
         car.move_vehicle(1)
-    except MoveVehicleNoPathFollowerDefinedError:
-        pass
-    else:
-        pytest.fail("MoveVehicleNoPathFollowerDefinedError should be raised.")
-    finally:
-        plt.close(fig)
+    plt.close(fig)
 
 
 def test_car_moving() -> None:
@@ -118,12 +118,8 @@ def test_connection_as_crossing() -> None:
 def test_invalid_connection_error() -> None:
     way1 = Way([Vertex(0, -10, 0), Vertex(1, 0, 0)])
     way2 = Way([Vertex(2, -10, 10), Vertex(3, 0, 10)])
-    try:
+    with pytest.raises(InvalidConnectionError):
         Connection(0, way1, way2)
-    except InvalidConnectionError:
-        pass
-    else:
-        pytest.fail("InvalidConnectionError should have been raised.")
 
 
 def test_check_crossing_reprocessing() -> None:
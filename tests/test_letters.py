@@ -28,12 +28,8 @@ def test_all_letters() -> None:
 
 def test_not_implemented_letter() -> None:
     fig, axes = plt.subplots()
-    try:
+    with pytest.raises(NotImplementedError):
         Letters(axes, "#")
-    except NotImplementedError:
-        pass
-    else:
-        pytest.fail("NotImplementedError should have been raised.")
 
 
 def test_colored_alfabet() -> None:
@@ -24,20 +24,12 @@ def test_normal_functionality_options() -> None:
 
 def test_unknown_option_error() -> None:
     # Create an Options object and try to add an option that is not valid.
-    try:
+    with pytest.raises(UnknownOptionError):
         Options(test=True)
-    except UnknownOptionError:
-        pass
-    else:
-        pytest.fail("UnknownOptionError should be raised.")
 
 
 def test_frozen_options_error() -> None:
     # Create an Options object and then try to add an option that is not valid.
     my_options = OptionsTest()
-    try:
+    with pytest.raises(FrozenOptionsError):
         my_options.test_me_too = True
-    except FrozenOptionsError:
-        pass
-    else:
-        pytest.fail("FrozenOptionsError should be raised.")
@@ -45,9 +45,5 @@ def test_path_follower_move_4m() -> None:
 
 def test_path_follower_length_not_set_error() -> None:
     path_follower = PathFollower(XDATA, YDATA)
-    try:
+    with pytest.raises(PathFollowerLengthNotSetError):
         path_follower.get_front_xy()
-    except PathFollowerLengthNotSetError:
-        pass
-    else:
-        pytest.fail("PathFollowerLengthNotSetError should be raised.")
@@ -4,15 +4,18 @@ Author(s): Erwin de Gelder
 """
 
 from pathlib import Path
+from typing import List
 
 import matplotlib as mpl
 import matplotlib.pyplot as plt
 import numpy as np
+import pytest
 from matplotlib.axes import Axes
 from matplotlib.figure import Figure
 
 from traffic_scene_renderer import (
     Building,
+    BuildingOptions,
     MaxSpeed,
     MaxSpeedOptions,
     Stripes,
@@ -20,6 +23,7 @@ from traffic_scene_renderer import (
     TurnArrow,
     TurnArrowOptions,
 )
+from traffic_scene_renderer.utilities import rotate
 
 mpl.use("Agg")
 
@@ -32,7 +36,14 @@ def save_fig(figure: Figure, axes: Axes, filename: Path, fwidth: float = 10) ->
     ylim = axes.get_ylim()
     figure.set_size_inches((fwidth, fwidth * (ylim[1] - ylim[0]) / (xlim[1] - xlim[0])))
     axes.set_axis_off()
-    figure.savefig(filename, bbox_inches="tight", pad_inches=0.0, facecolor=axes.get_facecolor())
+    # The images are only inspected, so a fast PNG compression is preferred over a small file.
+    figure.savefig(
+        filename,
+        bbox_inches="tight",
+        pad_inches=0.0,
+        facecolor=axes.get_facecolor(),
+        pil_kwargs={"compress_level": 1},
+    )
     plt.close(figure)
 
 
@@ -80,6 +91,18 @@ def test_building_creation() -> None:
     save_fig(fig, axes, Path("static_objects") / "building.png", 2)
 
 
+def test_building_default_corners() -> None:
+    fig, axes = plt.subplots()
+    building = Building(axes, BuildingOptions(size_x=4, size_y=2))
+    # The corners start at the top right and go clockwise.
+    assert building.options.x_data is not None
+    assert building.options.y_data is not None
+    assert np.array_equal(building.options.x_data, [2, 2, -2, -2])
+    assert np.array_equal(building.options.y_data, [1, -1, -1, 1])
+    assert np.array_equal(building.fills[0].get_xy()[:4], [[2, 1], [2, -1], [-2, -1], [-2, 1]])
+    plt.close(fig)
+
+
 def test_stripes_creation() -> None:
     fig, axes = plt.subplots()
     axes.set_xlim(-2, 2)
@@ -88,6 +111,92 @@ def test_stripes_creation() -> None:
     save_fig(fig, axes, Path("static_objects") / "stripes.png", 3)
 
 
+def _stripes_corners(width: float, length: float, nstripes: int) -> List[np.ndarray]:
+    # Reference: the corners of the stripes computed for each stripe separately.
+    w_stripe = (width + length) / nstripes
+    stripes = []
+    for i in range((nstripes + 1) // 2):
+        alphai, betai = 2 * i * w_stripe, (2 * i + 1) * w_stripe
+        xdata = [min(alphai, width)]
+        ydata = [alphai - xdata[0]]
+        if alphai < width < betai:
+            xdata.append(width)
+            ydata.append(0)
+        xdata.append(min(betai, width))
+        ydata.append(betai - xdata[-1])
+        if i < nstripes - 1:
+            ydata.append(min(betai, length))
+            xdata.append(betai - ydata[-1])
+        if alphai < length < betai:
+            xdata.append(0)
+            ydata.append(length)
+        if i > 0:
+            ydata.append(min(alphai, length))
+            xdata.append(alphai - ydata[-1])
+        stripes.append(np.column_stack((np.array(xdata) - width / 2, length / 2 - np.array(ydata))))
+    return stripes
+
+
+def test_stripes_corners() -> None:
+    fig, axes = plt.subplots()
+    for width, length in ((0.5, 3.5), (3.5, 0.5), (1.0, 1.0)):
+        for nstripes in (1, 2, 5, 10, 20):
+            for angle in (0, np.pi / 3, np.pi):
+                stripes = Stripes(
+                    axes, options=StripesOptions(width=width, length=length, nstripes=nstripes)
+                )
+                stripes.change_pos(0, 0, angle)
+                expected = _stripes_corners(width, length, nstripes)
+                paths = stripes.collections[0].get_paths()
+                assert len(paths) == len(expected)
+                for path, corners in zip(paths, expected):
+                    x_data, y_data = rotate(corners[:, 0], corners[:, 1], -angle)
+                    np.testing.assert_allclose(
+                        np.asarray(path.vertices)[: len(corners)],
+                        np.column_stack((x_data, y_data)),
+                        atol=1e-12,
+                    )
+    plt.close(fig)
+
+
+def _stripes_vertices(stripes: Stripes) -> List[np.ndarray]:
+    plot = stripes.plots[0]
+    return [
+        np.column_stack((plot.get_xdata(), plot.get_ydata())),
+        stripes.fills[0].get_xy(),
+        *[np.asarray(path.vertices) for path in stripes.collections[0].get_paths()],
+    ]
+
+
+def test_stripes_change_pos(monkeypatch: pytest.MonkeyPatch) -> None:
+    fig, axes = plt.subplots()
+    stripes = Stripes(axes, options=StripesOptions(width=0.5, length=3.5))
+    original = _stripes_vertices(stripes)
+
+    # Only translating: all vertices (of the plot, the fill, and the stripes) are shifted.
+    stripes.change_pos(1, 2)
+    for xy_data, xy_original in zip(_stripes_vertices(stripes), original):
+        np.testing.assert_allclose(xy_data, np.add(xy_original, [1, 2]))
+
+    # Rotating (clockwise) and translating.
+    stripes.change_pos(-1, 0, np.pi / 2)
+    for xy_data, xy_original in zip(_stripes_vertices(stripes), original):
+        np.testing.assert_allclose(xy_data, xy_original[:, ::-1] * [1, -1] + [-1, 0], atol=1e-12)
+
+    # Back to the original pose.
+    stripes.change_pos(0, 0)
+    for xy_data, xy_original in zip(_stripes_vertices(stripes), original):
+        np.testing.assert_allclose(xy_data, xy_original, atol=1e-12)
+
+    # If the pose does not change, nothing is updated.
+    def set_xy(_: np.ndarray) -> None:
+        raise AssertionError
+
+    monkeypatch.setattr(stripes.fills[0], "set_xy", set_xy)
+    stripes.change_pos(0, 0)
+    plt.close(fig)
+
+
 def test_stripes_change_colors() -> None:
     fig, axes = plt.subplots()
     axes.set_xlim(-2, 2)
@@ -73,15 +73,30 @@ def test_traffic_light_status_no_amber() -> None:
     save_fig(fig, axes, Path("traffic_light") / "no_amber_status.png", 8)
 
 
+def test_traffic_light_status_reuses_artists() -> None:
+    fig, axes = plt.subplots()
+    traffic_light = TrafficLight(axes, TrafficLightOptions(radius=0.5))
+    n_patches = len(axes.patches)
+    for status in (
+        TrafficLightStatus.RED,
+        TrafficLightStatus.AMBER,
+        TrafficLightStatus.GREEN,
+        TrafficLightStatus.IDLE,
+    ):
+        traffic_light.set_status(status)
+        assert len(axes.patches) == n_patches
+        assert len(axes.collections) == 1
+    traffic_light.set_status(TrafficLightStatus.REMOVED)
+    assert not axes.patches
+    assert not axes.collections
+    plt.close(fig)
+
+
 def test_no_amber_error() -> None:
     fig, axes = plt.subplots()
     traffic_light = TrafficLight(axes, TrafficLightOptions(amber=False))
-    try:
+    with pytest.raises(NoAmberError):
         traffic_light.set_status(TrafficLightStatus.AMBER)
-    except NoAmberError:
-        pass
-    else:
-        pytest.fail("NoAmberError should be raised.")
     plt.close(fig)
 
 
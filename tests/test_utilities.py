@@ -0,0 +1,53 @@
+"""Scripts for testing all functionalities from utilities.py.
+
+Author(s): Erwin de Gelder
+"""
+
+import numpy as np
+import pytest
+
+from traffic_scene_renderer.utilities import hsl2rgb, wgs_to_utm
+
+
+def test_wgs_to_utm_crossing_zones() -> None:
+    # The second point is in zone 32, but it is converted using the zone of the first point.
+    points_utm, zone_number, zone_letter = wgs_to_utm(
+        np.array([[51.474457, 5.623897], [51.5, 6.5]])
+    )
+    assert (zone_number, zone_letter) == (31, "U")
+    assert points_utm[0] == pytest.approx((682219.44, 5705853.69), abs=0.01)
+    single_point_utm, _, _ = wgs_to_utm(np.array([[51.5, 6.5]]), force_zone_number=31)
+    assert points_utm[1] == pytest.approx(single_point_utm[0])
+    assert points_utm[1, 0] > points_utm[0, 0]  # Continuous: further east means larger easting.
+
+
+def test_wgs_to_utm_crossing_equator() -> None:
+    # The second point is on the southern hemisphere, but it uses the letter of the first point,
+    # so its northing is negative instead of including the false northing of 10000 km.
+    points_utm, zone_number, zone_letter = wgs_to_utm(np.array([[0.5, 5.0], [-0.5, 5.0]]))
+    assert (zone_number, zone_letter) == (31, "N")
+    assert points_utm[1, 0] == pytest.approx(points_utm[0, 0])
+    assert points_utm[1, 1] == pytest.approx(-points_utm[0, 1])
+    assert points_utm[1, 1] < 0
+
+
+def test_hsl2rgb_sectors() -> None:
+    # Fully saturated colors at the bounds of the hue, at the sector boundaries, and in between.
+    for hue, rgb in (
+        (0, (1.0, 0.0, 0.0)),
+        (1 / 12, (1.0, 0.5, 0.0)),
+        (1 / 6, (1.0, 1.0, 0.0)),
+        (1 / 3, (0.0, 1.0, 0.0)),
+        (1 / 2, (0.0, 1.0, 1.0)),
+        (7 / 12, (0.0, 0.5, 1.0)),
+        (2 / 3, (0.0, 0.0, 1.0)),
+        (5 / 6, (1.0, 0.0, 1.0)),
+        (1, (1.0, 0.0, 0.0)),
+    ):
+        assert hsl2rgb(hue, 1, 0.5) == pytest.approx(rgb)
+
+
+def test_hsl2rgb_saturation_luminance() -> None:
+    assert hsl2rgb(0.5, 0, 0.3) == pytest.approx((0.3, 0.3, 0.3))
+    assert hsl2rgb(0, 0.5, 0.25) == pytest.approx((0.375, 0.125, 0.125))
+    assert hsl2rgb(2 / 3, 1, 1) == pytest.approx((1.0, 1.0, 1.0))
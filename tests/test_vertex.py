@@ -3,7 +3,9 @@
 Author(s): Erwin de Gelder
 """
 
-from traffic_scene_renderer import Vertex, VertexOptions
+import pytest
+
+from traffic_scene_renderer import InvalidVertexDataError, Vertex, VertexOptions, generate_vertices
 
 
 def test_vertex_creation() -> None:
@@ -20,4 +22,34 @@ def test_vertex_creation_with_latlon() -> None:
 
 def test_vertex_get_xy() -> None:
     vertex = Vertex(0, 1, 2)
-    assert vertex.get_xy() == [1, 2]
+    assert vertex.get_xy() == (1, 2)
+
+
+def test_generate_vertices() -> None:
+    vertices = generate_vertices([[0, 0], [1, 2]], idx_start=3)
+    assert [vertex.idx for vertex in vertices] == [3, 4]
+    assert vertices[1].get_xy() == (1, 2)
+
+
+def test_generate_vertices_with_latlon() -> None:
+    vertex_options = VertexOptions(latlon=True)
+    vertices = generate_vertices([[51.474457, 5.623897], [51.474457, 5.623897]], vertex_options)
+    assert [str(vertex) for vertex in vertices] == [
+        "Vertex[ID=0, x=682219.44, y=5705853.69]",
+        "Vertex[ID=1, x=682219.44, y=5705853.69]",
+    ]
+
+    # The provided options are left untouched and each vertex has its own options.
+    assert vertex_options.zonenumber is None
+    assert vertices[0].options is not vertices[1].options
+    assert [(vertex.options.latlon, vertex.options.zonenumber) for vertex in vertices] == [
+        (False, 31),
+        (False, 31),
+    ]
+
+
+def test_generate_vertices_invalid_data_error() -> None:
+    with pytest.raises(InvalidVertexDataError):
+        generate_vertices([0, 0, 1, 2, 3, 4])
+    with pytest.raises(InvalidVertexDataError):
+        generate_vertices([[0, 0, 0], [1, 2, 3]])
@@ -11,8 +11,10 @@ import matplotlib.pyplot as plt
 import numpy as np
 import pytest
 from matplotlib.axes import Axes
+from matplotlib.collections import LineCollection
 
 from traffic_scene_renderer import Crossing, IndexVertexError, Vertex, Way, WayOptions
+from traffic_scene_renderer.way import apply_offset, offset_directions
 
 from .test_static_objects import save_fig
 
@@ -23,9 +25,9 @@ def plot_way(axes: Axes, way: Way) -> None:
     axes.plot(way.parms.left.x_data, way.parms.left.y_data, color=way.options.side_color)
     axes.plot(way.parms.right.x_data, way.parms.right.y_data, color=way.options.side_color)
     if way.parms.plot.lines:
-        lines = np.array(way.parms.plot.lines)
-        axes.plot(
-            [lines[:, 0], lines[:, 2]], [lines[:, 1], lines[:, 3]], color=way.options.line_color
+        lines = list(np.reshape(way.parms.plot.lines, (-1, 2, 2)))
+        axes.add_collection(
+            LineCollection(lines, colors=way.options.line_color, capstyle="projecting")
         )
     way.plot_markers(axes)
 
@@ -170,18 +172,10 @@ def test_warning_lambda() -> None:
 
 def test_vertex_invalid_index_error() -> None:
     way = Way([Vertex(0, 0, 0), Vertex(1, 10, 0)])
-    try:
+    with pytest.raises(IndexVertexError):
         way.insert_vertex(Vertex(2, 5, 0), -2)
-    except IndexVertexError:
-        pass
-    else:
-        pytest.fail("IndexInsertVertexError should be raised.")
-    try:
+    with pytest.raises(IndexVertexError):
         way.pop_vertex(0)
-    except IndexVertexError:
-        pass
-    else:
-        pytest.fail("IndexInsertVertexError should be raised.")
 
 
 def test_set_nlanes() -> None:
@@ -219,6 +213,35 @@ def test_apply_offset() -> None:
     save_fig(fig, axes, Path("way") / "apply_offset.png", 10)
 
 
+def test_offset_directions_bent_line() -> None:
+    # A line going to the right and then turning left by 90 degrees. At the bend, the direction
+    # is the corner of the lines that are parallel to both sections.
+    xy_data = np.array([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0]])
+    directions = np.array([[0.0, 1.0], [-1.0, 1.0], [-1.0, 0.0]])
+    np.testing.assert_allclose(offset_directions(xy_data), directions, atol=1e-12)
+
+    # Scalar offset, offsets at both ends (interpolated by distance), and an offset per node.
+    np.testing.assert_allclose(apply_offset(xy_data, 0.5), xy_data + 0.5 * directions)
+    np.testing.assert_allclose(
+        apply_offset(xy_data, [0.0, 2.0]), xy_data + [[0.0], [1.0], [2.0]] * directions
+    )
+    np.testing.assert_allclose(
+        apply_offset(xy_data, [1.0, 2.0, 3.0]), xy_data + [[1.0], [2.0], [3.0]] * directions
+    )
+
+    # Without offset, a copy of the line is returned.
+    for offset in (0, [0.0, 0.0]):
+        new_xy_data = apply_offset(xy_data, offset)
+        assert new_xy_data is not xy_data
+        assert np.array_equal(new_xy_data, xy_data)
+
+
+def test_apply_offset_too_short() -> None:
+    way = Way([Vertex(0, -10, 0), Vertex(1, 0, 0), Vertex(2, 10, 0), Vertex(3, 20, 0)])
+    with pytest.raises(IndexError):
+        way.apply_offset([0.5, 1, 2])
+
+
 def test_road_markers() -> None:
     fig, axes = plt.subplots()
     axes.set_xlim(-10, 10)